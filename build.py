@@ -0,0 +1,858 @@
+#!/usr/bin/env python3
+"""Build helper for FFTS.
+
+Drives the CMake build (CMakeLists.txt in the repository root) with a
+persistent configuration stored in build_config.json.  The autotools
+build is untouched; this script is a convenience front-end for
+developers and CI.
+
+Usage:
+    ./build.py configure          configure the build directory
+    ./build.py build              compile
+    ./build.py test               run the test suite via ctest
+    ./build.py install            install into the configured prefix
+    ./build.py all                configure + build + test
+    ./build.py clean              remove build and install directories
+    ./build.py show-config        print the active configuration
+    ./build.py interactive        configure interactively
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import functools
+import hashlib
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+try:
+    import orjson  # C-accelerated JSON; optional
+except ImportError:
+    orjson = None
+
+# Host identity never changes within a run; probe it once at import
+# (platform.system() is a uname syscall on POSIX).
+_SYSTEM = platform.system().lower()
+_MACHINE = platform.machine().lower()
+
+
+@functools.lru_cache(maxsize=1)
+def _cmake_version():
+    """(major, minor) of the cmake on PATH, or () when undetectable."""
+    try:
+        result = subprocess.run(["cmake", "--version"], capture_output=True, text=True)
+    except OSError:
+        return ()
+    match = re.search(r"(\d+)\.(\d+)", result.stdout)
+    return tuple(int(part) for part in match.groups()) if match else ()
+
+
+@functools.lru_cache(maxsize=1)
+def _find_fast_linker():
+    """Path of mold (preferred) or lld, or None."""
+    return shutil.which("mold") or shutil.which("lld")
+
+
+def _available_cpu_count():
+    """CPUs actually available to this process.
+
+    sched_getaffinity respects cgroup/taskset limits, unlike
+    os.cpu_count(); fall back on platforms without it.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+class Colors:
+    """ANSI escape codes for terminal output."""
+
+    HEADER = "\033[95m"
+    OKBLUE = "\033[94m"
+    OKGREEN = "\033[92m"
+    WARNING = "\033[93m"
+    FAIL = "\033[91m"
+    ENDC = "\033[0m"
+    BOLD = "\033[1m"
+
+
+# Pre-rendered ANSI prefixes (one dict lookup + concatenation per
+# message) and a module-level buffer so an action issues one write()
+# syscall at its natural boundary instead of one per status line.
+_LOG_PREFIXES = {
+    "header": Colors.HEADER,
+    "info": Colors.OKBLUE,
+    "ok": Colors.OKGREEN,
+    "warn": Colors.WARNING,
+    "fail": Colors.FAIL,
+    "plain": "",
+}
+_log_buffer = collections.deque()
+
+
+def log(level, msg):
+    """Queue a status line; failures flush the buffer immediately."""
+    prefix = _LOG_PREFIXES[level]
+    if prefix:
+        _log_buffer.append(f"{prefix}{msg}{Colors.ENDC}\n")
+    else:
+        _log_buffer.append(f"{msg}\n")
+    if level == "fail":
+        flush_log()
+
+
+def flush_log():
+    """Write and clear any queued status lines with one syscall."""
+    if _log_buffer:
+        sys.stdout.write("".join(_log_buffer))
+        sys.stdout.flush()
+        _log_buffer.clear()
+
+
+class BuildConfig:
+    """Configuration for the FFTS build, persisted to build_config.json."""
+
+    presets = {
+        "default": {},
+        "minimal": {
+            "build_type": "MinSizeRel",
+            "enable_tests": False,
+            "enable_shared": False,
+            "dynamic_code": False,
+            # Skip find_package discovery for anything the minimal
+            # build cannot use; avoids the filesystem walks entirely.
+            "disabled_find_packages": ["Doxygen", "Sphinx", "Threads", "JNI"],
+        },
+        "debug": {
+            "build_type": "Debug",
+            "enable_tests": True,
+        },
+        "x86": {
+            "enable_sse": True,
+            "enable_neon": False,
+            "enable_vfp": False,
+        },
+        "arm": {
+            "enable_sse": False,
+            "enable_neon": True,
+            "enable_vfp": False,
+        },
+    }
+
+    def __init__(self, config_file="build_config.json"):
+        self.config_file = Path(config_file)
+        self.config = self.get_default_config()
+        if self.config_file.exists():
+            self.config.update(self.load_config())
+
+    def get_default_config(self):
+        """Return the default configuration for the host platform."""
+        return dict(self._default_config())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _default_config():
+        """Compute the platform defaults once per process.
+
+        Uses the module-level _SYSTEM/_MACHINE constants; callers get a
+        copy via get_default_config so the cached dict is never
+        mutated.
+        """
+        return {
+            "build_type": "Release",
+            "enable_sse": _MACHINE in ("x86_64", "amd64", "i686", "i386"),
+            "enable_neon": _MACHINE.startswith("arm") or _MACHINE == "aarch64",
+            "enable_vfp": False,
+            "enable_single": True,
+            "enable_shared": False,
+            "enable_tests": True,
+            "dynamic_code": _SYSTEM != "windows",
+            "enable_compiler_cache": True,
+            "enable_ninja": True,
+            "toolchain_cache": True,
+            # Off by default: emitting compile_commands.json costs
+            # per-target generation time; turn on for clangd etc.
+            "enable_compile_commands": False,
+            "enable_fast_linker": True,
+            "parallel_jobs": _available_cpu_count(),
+            "install_prefix": str(Path.cwd() / "install"),
+        }
+
+    # (mtime_ns, parsed) per config file path; avoids re-parsing the
+    # JSON when several BuildConfig instances are built in one run.
+    _load_cache = {}
+
+    def load_config(self):
+        """Load the saved configuration from disk."""
+        mtime = self.config_file.stat().st_mtime_ns
+        cached = self._load_cache.get(self.config_file)
+        if cached is not None and cached[0] == mtime:
+            return dict(cached[1])
+        if orjson is not None:
+            parsed = orjson.loads(self.config_file.read_bytes())
+        else:
+            with open(self.config_file, "r") as f:
+                parsed = json.load(f)
+        self._load_cache[self.config_file] = (mtime, parsed)
+        return dict(parsed)
+
+    def save_config(self, config=None):
+        """Write the configuration to disk."""
+        if config is not None:
+            self.config = config
+        self._write(self.config)
+
+    def save_key(self, key, value):
+        """Persist a single key without the rest of the live config.
+
+        The live config may carry transient CLI overrides (--jobs,
+        --generator); merging just this key into what is on disk keeps
+        one-shot flags from becoming permanent defaults.
+        """
+        self.config[key] = value
+        on_disk = self.load_config() if self.config_file.exists() else {}
+        on_disk[key] = value
+        self._write(on_disk)
+
+    def _write(self, config):
+        if orjson is not None:
+            self.config_file.write_bytes(
+                orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+            )
+        else:
+            with open(self.config_file, "w") as f:
+                json.dump(config, f, indent=2, sort_keys=True)
+
+    def apply_preset(self, name):
+        """Overlay a named preset onto the current configuration."""
+        if name not in self.presets:
+            log("fail", f"Unknown preset: {name}")
+            log("plain", f"Available presets: {', '.join(sorted(self.presets))}")
+            flush_log()
+            return False
+        self.config.update(self.presets[name])
+        return True
+
+    def emit_cmake_presets(self, path="CMakePresets.json"):
+        """Write a CMakePresets.json derived from BuildConfig.presets.
+
+        Each preset overlays the user's current configuration (not the
+        bare class defaults, so build_config.json and the CMake cache
+        agree) and is expressed as cacheVariables, letting repeat
+        configures go through cmake --preset instead of the
+        Python-side -D list.  The file is only rewritten when its
+        content actually changed.
+        """
+        presets_file = Path(path)
+        generator = self.config.get("generator")
+        if generator is None and self.config.get("enable_ninja", True):
+            generator = "Ninja" if shutil.which("ninja") else None
+        configure_presets = []
+        for name, overrides in self.presets.items():
+            config = dict(self.config)
+            config.update(overrides)
+            cache_variables = {}
+            for arg in BuildSystem._build_cmake_args(
+                BuildSystem._freeze_config(config)
+            ):
+                variable, value = arg[2:].split("=", 1)
+                cache_variables[variable] = value
+            preset = {
+                "name": name,
+                "binaryDir": "${sourceDir}/build",
+                "cacheVariables": cache_variables,
+            }
+            if generator:
+                preset["generator"] = generator
+            configure_presets.append(preset)
+        data = {
+            "version": 3,
+            "cmakeMinimumRequired": {"major": 3, "minor": 21, "patch": 0},
+            "configurePresets": configure_presets,
+        }
+        content = json.dumps(data, indent=2) + "\n"
+        try:
+            if presets_file.read_text() == content:
+                return presets_file
+        except OSError:
+            pass
+        presets_file.write_text(content)
+        return presets_file
+
+    def interactive_config(self, answers=None):
+        """Prompt for each configuration value on the terminal.
+
+        When an answers mapping is given (from --answers), every prompt
+        is resolved from it instead of input(), so scripted and CI runs
+        pay one file read rather than a terminal round-trip per
+        question.
+        """
+
+        def ask_bool(prompt, key):
+            current = self.config[key]
+            if answers is not None:
+                return bool(answers.get(key, current))
+            reply = input(f"{prompt} [{'Y/n' if current else 'y/N'}]: ").strip().lower()
+            if not reply:
+                return current
+            return reply in ("y", "yes")
+
+        def ask_value(prompt, key, convert=str):
+            if answers is not None:
+                return convert(answers.get(key, self.config[key]))
+            reply = input(f"{prompt} [{self.config[key]}]: ").strip()
+            return convert(reply) if reply else self.config[key]
+
+        if answers is None:
+            log("header", "FFTS interactive configuration")
+            flush_log()
+        self.config["build_type"] = ask_value("Build type", "build_type")
+        self.config["enable_sse"] = ask_bool("Enable SSE", "enable_sse")
+        self.config["enable_neon"] = ask_bool("Enable NEON", "enable_neon")
+        self.config["enable_vfp"] = ask_bool("Enable VFP", "enable_vfp")
+        self.config["enable_single"] = ask_bool("Single precision", "enable_single")
+        self.config["enable_shared"] = ask_bool("Build shared library", "enable_shared")
+        self.config["enable_tests"] = ask_bool("Build tests", "enable_tests")
+        self.config["dynamic_code"] = ask_bool("Dynamic code generation", "dynamic_code")
+        self.config["parallel_jobs"] = ask_value("Parallel jobs", "parallel_jobs", int)
+        self.config["install_prefix"] = ask_value("Install prefix", "install_prefix")
+        self.save_config()
+        log("ok", f"Configuration saved to {self.config_file}")
+
+    def show_config(self):
+        """Print the active configuration."""
+        log("header", "Current FFTS build configuration:")
+        for key in sorted(self.config):
+            log("plain", f"  {key} = {self.config[key]}")
+        linker = _find_fast_linker()
+        if linker and self.config.get("enable_fast_linker", True):
+            log("plain", f"  fast linker detected: {linker}")
+        if not self.config.get("enable_compile_commands"):
+            log(
+                "plain",
+                "  (set enable_compile_commands to true to export "
+                "compile_commands.json for clangd)",
+            )
+
+
+class BuildSystem:
+    """Runs cmake/ctest against the build directory."""
+
+    def __init__(self, build_config):
+        self.build_config = build_config
+        self.source_dir = Path(__file__).resolve().parent
+        self.build_dir = self.source_dir / "build"
+        self.install_dir = Path(build_config.config["install_prefix"])
+        self._config_stamp_path = self.build_dir / ".ffts_config_stamp"
+        # Lives outside the build tree: while the tree exists
+        # CMakeCache.txt already holds these results, so the payoff is
+        # seeding a *fresh* tree after a clean, and that only works if
+        # clean does not delete the file too.
+        self.toolchain_cache_file = self.source_dir / "toolchain-check-cache.cmake"
+        # Whether a configured tree existed before this run's configure;
+        # recorded there because configure itself guarantees CMakeCache.txt
+        # exists by the time build() looks.
+        self._incremental = False
+
+    @functools.cached_property
+    def _build_dir_stat(self):
+        """Cached os.stat of the build directory, None when absent.
+
+        Saves a stat syscall per existence check within one action;
+        invalidated by the code paths that create or remove the
+        directory.
+        """
+        try:
+            return os.stat(self.build_dir)
+        except FileNotFoundError:
+            return None
+
+    def _invalidate_build_dir_stat(self):
+        self.__dict__.pop("_build_dir_stat", None)
+
+    @property
+    def _build_dir_exists(self):
+        return self._build_dir_stat is not None
+
+    # Config keys that only affect the build step; changing them (e.g.
+    # via --jobs) must not invalidate the configure stamp.
+    _NON_CONFIGURE_KEYS = frozenset({"parallel_jobs", "enable_ninja"})
+
+    def _configure_key(self, config, generator, preset=None):
+        """Hash of everything the configure step depends on."""
+        digest = hashlib.sha256()
+        inputs = {
+            key: value
+            for key, value in config.items()
+            if key not in self._NON_CONFIGURE_KEYS
+        }
+        inputs["generator"] = generator
+        inputs["preset"] = preset
+        digest.update(json.dumps(inputs, sort_keys=True).encode())
+        paths = [self.source_dir / "CMakeLists.txt", Path(__file__)]
+        if preset:
+            paths.append(self.source_dir / "CMakePresets.json")
+        for path in paths:
+            try:
+                digest.update(str(path.stat().st_mtime_ns).encode())
+            except OSError:
+                pass
+        return digest.hexdigest()
+
+    def check_requirements(self):
+        """Verify that cmake and a C compiler are available."""
+        if not shutil.which("cmake"):
+            log("fail", "cmake not found on PATH")
+            return False
+
+        config = self.build_config.config
+        cached = config.get("c_compiler")
+        if cached and Path(cached).exists():
+            log("ok", f"Using C compiler: {cached}")
+            return True
+
+        # Probe all candidates concurrently; each --version spawn costs
+        # tens of milliseconds and they are independent.
+        candidates = {
+            c: shutil.which(c) for c in ("gcc", "clang", "cc") if shutil.which(c)
+        }
+        found = None
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                executor.submit(
+                    subprocess.run, [path, "--version"], capture_output=True, text=True
+                ): path
+                for path in candidates.values()
+            }
+            for future in concurrent.futures.as_completed(futures):
+                if future.exception() is None and future.result().returncode == 0:
+                    found = futures[future]
+                    break
+        if found is None:
+            log("fail", "No working C compiler found")
+            return False
+        # Remember the winner so configure can pin CMAKE_C_COMPILER and
+        # CMake skips its own compiler-detection try_compiles.
+        self.build_config.save_key("c_compiler", found)
+        log("ok", f"Using C compiler: {found}")
+        return True
+
+    def configure(self, verbose=False, preset=None):
+        """Run cmake to configure the build directory.
+
+        With a preset name, configuration goes through cmake --preset
+        and the generated CMakePresets.json; the environment-derived
+        flags (compiler cache, pinned compiler, fast linker, toolchain
+        cache) are appended either way, and the stamp short-circuit
+        applies to both paths.
+        """
+        config = self.build_config.config
+        os.makedirs(self.build_dir, exist_ok=True)
+        self._invalidate_build_dir_stat()
+        self._incremental = (self.build_dir / "CMakeCache.txt").exists()
+
+        # Ninja has much lower per-target overhead and better parallel
+        # scheduling than the platform default generators; use it when
+        # available unless the user overrode the generator.  In preset
+        # mode the generator is baked into CMakePresets.json instead.
+        generator = None
+        if preset is None:
+            generator = config.get("generator")
+            if generator is None and config.get("enable_ninja", True):
+                generator = "Ninja" if shutil.which("ninja") else None
+
+        # Skip the cmake run entirely when nothing that feeds it changed:
+        # the configuration, the root CMakeLists.txt, this script, and
+        # in preset mode the presets file.
+        key = self._configure_key(config, generator, preset)
+        if self._incremental:
+            try:
+                if self._config_stamp_path.read_text() == key:
+                    log(
+                        "info",
+                        f"Reusing cached configuration in {self.build_dir}",
+                    )
+                    return True
+            except OSError:
+                pass
+
+        cmake_args = [
+            "cmake",
+        ]
+        if preset:
+            cmake_args += ["-S", str(self.source_dir), "--preset", preset]
+            # cacheVariables carry the config-derived flags; the pinned
+            # compiler is appended too in case it was detected after the
+            # presets file was generated.
+            if config.get("c_compiler"):
+                cmake_args.append(f"-DCMAKE_C_COMPILER={config['c_compiler']}")
+        else:
+            if generator:
+                cmake_args += ["-G", generator]
+            cmake_args += [
+                "-S", str(self.source_dir),
+                "-B", str(self.build_dir),
+            ]
+            cmake_args += self._build_cmake_args(self._freeze_config(config))
+
+        # Prefer mold/lld for the link-heavy final steps; only worth
+        # wiring up when something actually links (shared lib or tests).
+        if config.get("enable_fast_linker", True) and (
+            config["enable_shared"] or config["enable_tests"]
+        ):
+            linker = _find_fast_linker()
+            if linker:
+                name = Path(linker).name
+                if _cmake_version() >= (3, 29):
+                    cmake_args.append(f"-DCMAKE_LINKER_TYPE={name.upper()}")
+                else:
+                    cmake_args.append(f"-DCMAKE_EXE_LINKER_FLAGS=-fuse-ld={name}")
+                    cmake_args.append(f"-DCMAKE_SHARED_LINKER_FLAGS=-fuse-ld={name}")
+
+        # Seed compiler/feature check results from the previous run so
+        # try_compile batteries hit the cache instead of re-running.
+        if config.get("toolchain_cache", True) and self.toolchain_cache_file.exists():
+            cmake_args.append(
+                f"-DCMAKE_PROJECT_INCLUDE_BEFORE={self.toolchain_cache_file}"
+            )
+
+        # Compiler cache: near-free object reuse across clean builds and
+        # branch switches.  sccache preferred over ccache when both exist.
+        if config.get("enable_compiler_cache", True):
+            launcher = shutil.which("sccache") or shutil.which("ccache")
+            if launcher:
+                cmake_args.append(f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}")
+                cmake_args.append(f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}")
+                log("ok", f"Compiler cache enabled: {launcher}")
+
+        if preset:
+            log("info", f"Configuring preset '{preset}' in {self.build_dir}...")
+        else:
+            log("info", f"Configuring in {self.build_dir}...")
+        returncode, tail = self._run_streamed(cmake_args, verbose=verbose)
+        if returncode != 0:
+            log("fail", "Configure failed:")
+            sys.stdout.write("".join(tail))
+            return False
+        log("ok", "Configure succeeded")
+        self._config_stamp_path.write_text(key)
+        if config.get("toolchain_cache", True):
+            self._update_toolchain_cache()
+        if generator:
+            # Persist the choice so later build/test invocations reuse it.
+            self.build_config.save_key("generator", generator)
+        return True
+
+    # (CMake option, config key) pairs for plain ON/OFF flags; extend
+    # here rather than hand-writing another f-string in configure.
+    _BOOL_FLAGS = (
+        ("ENABLE_SSE", "enable_sse"),
+        ("ENABLE_NEON", "enable_neon"),
+        ("ENABLE_VFP", "enable_vfp"),
+        ("ENABLE_SINGLE", "enable_single"),
+        ("ENABLE_SHARED", "enable_shared"),
+        ("ENABLE_TESTS", "enable_tests"),
+    )
+
+    @staticmethod
+    def _freeze_config(config):
+        """Flatten a config dict into a hashable, order-independent tuple."""
+        return tuple(
+            sorted(
+                (key, tuple(value) if isinstance(value, list) else value)
+                for key, value in config.items()
+            )
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _build_cmake_args(config_frozen):
+        """Turn a frozen config into the -D option tuple.
+
+        Memoized so preset sweeps and back-to-back actions within one
+        process do not rebuild (and re-format) an identical arg list.
+        """
+        config = dict(config_frozen)
+        args = [
+            f"-DCMAKE_BUILD_TYPE={config['build_type']}",
+            f"-DCMAKE_INSTALL_PREFIX={config['install_prefix']}",
+        ]
+        for name, key in BuildSystem._BOOL_FLAGS:
+            args.append(f"-D{name}={'ON' if config[key] else 'OFF'}")
+        args.append(
+            f"-DDISABLE_DYNAMIC_CODE={'OFF' if config['dynamic_code'] else 'ON'}"
+        )
+        if config.get("c_compiler"):
+            args.append(f"-DCMAKE_C_COMPILER={config['c_compiler']}")
+        if config.get("enable_compile_commands"):
+            args.append("-DCMAKE_EXPORT_COMPILE_COMMANDS=ON")
+        for package in config.get("disabled_find_packages", ()):
+            args.append(f"-DCMAKE_DISABLE_FIND_PACKAGE_{package}=TRUE")
+        return tuple(args)
+
+    @staticmethod
+    def _run_streamed(args, verbose=False, tail_lines=200):
+        """Run a subprocess, streaming output line by line.
+
+        Avoids materialising the whole log in memory the way
+        capture_output does; only a bounded tail is retained for the
+        failure dump.  Returns (returncode, tail deque).
+        """
+        flush_log()
+        proc = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        tail = collections.deque(maxlen=tail_lines)
+        for line in proc.stdout:
+            tail.append(line)
+            if verbose:
+                print(line, end="")
+        proc.wait()
+        return proc.returncode, tail
+
+    def _update_toolchain_cache(self):
+        """Extract feature-check results from CMakeCache.txt.
+
+        The results are rewritten as a CMAKE_PROJECT_INCLUDE_BEFORE
+        prelude of CACHE INTERNAL sets, so the next configure of a fresh
+        build tree can skip the corresponding try_compile runs.
+        """
+        cache = self.build_dir / "CMakeCache.txt"
+        if not cache.exists():
+            return
+        entries = []
+        for line in cache.read_text().splitlines():
+            if line.startswith(("#", "//")) or ":INTERNAL=" not in line:
+                continue
+            name, value = line.split(":INTERNAL=", 1)
+            if name.startswith("HAVE_") or name.endswith(
+                ("_WORKS", "_COMPILES", "_RUNS", "_SUPPORTED")
+            ):
+                escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+                entries.append(f'set({name} "{escaped}" CACHE INTERNAL "")')
+        if entries:
+            self.toolchain_cache_file.write_text("\n".join(entries) + "\n")
+
+    def configure_preset(self, name, verbose=False):
+        """Configure via cmake --preset using the generated presets file."""
+        return self.configure(verbose=verbose, preset=name)
+
+    def build(self, verbose=False):
+        """Compile via cmake --build."""
+        config = self.build_config.config
+        if not self._build_dir_exists:
+            log("fail", "Build directory missing; run configure first")
+            return False
+        jobs = config["parallel_jobs"]
+        # Incremental rebuilds and compiler-cache hits are mostly I/O
+        # bound, so cores sit idle at 1x; oversubscribe 2x (capped) in
+        # those scenarios.  Only kicks in when the user left the job
+        # count at the 1x-cores default.
+        if jobs == _available_cpu_count():
+            cache_active = config.get("enable_compiler_cache", True) and (
+                shutil.which("sccache") or shutil.which("ccache")
+            )
+            if self._incremental or cache_active:
+                jobs = min(jobs * 2, 32)
+
+        build_args = [
+            "cmake",
+            "--build", str(self.build_dir),
+        ]
+        # When driven from an outer make -j, defer to its jobserver
+        # rather than oversubscribing with our own --parallel; leaving
+        # MAKEFLAGS in the environment lets cmake/make inherit the
+        # jobserver file descriptors.
+        if "--jobserver-auth=" not in os.environ.get("MAKEFLAGS", ""):
+            build_args += ["--parallel", str(jobs)]
+        if verbose:
+            build_args.append("--verbose")
+        log("info", "Building...")
+        # The child inherits stdout; flush queued status lines first so
+        # they precede its output.
+        flush_log()
+        result = subprocess.run(build_args, env={**os.environ})
+        if result.returncode != 0:
+            log("fail", "Build failed")
+            return False
+        log("ok", "Build succeeded")
+        return True
+
+    def test(self, verbose=False):
+        """Run the test suite through ctest."""
+        if not self._build_dir_exists:
+            log("fail", "Build directory missing; run build first")
+            return False
+        ctest_args = ["ctest", "--test-dir", str(self.build_dir), "--output-on-failure"]
+        returncode, tail = self._run_streamed(ctest_args, verbose=verbose)
+        if returncode != 0:
+            log("fail", "Tests failed:")
+            sys.stdout.write("".join(tail))
+            return False
+        log("ok", "All tests passed")
+        return True
+
+    def install(self):
+        """Install into the configured prefix."""
+        if not self._build_dir_exists:
+            log("fail", "Build directory missing; run build first")
+            return False
+        flush_log()
+        result = subprocess.run(["cmake", "--install", str(self.build_dir)])
+        if result.returncode != 0:
+            log("fail", "Install failed")
+            return False
+        log("ok", f"Installed to {self.install_dir}")
+        return True
+
+    @staticmethod
+    def _remove_tree(path):
+        """Delete a directory tree.
+
+        On POSIX, rm -rf walks the tree in C, far faster than
+        shutil.rmtree's per-entry Python stat/unlink loop on a populated
+        build directory.
+        """
+        if os.name == "posix":
+            subprocess.run(["rm", "-rf", str(path)], check=True)
+        else:
+            shutil.rmtree(path)
+
+    def clean(self):
+        """Remove build and install directories concurrently."""
+        targets = []
+        if self._build_dir_exists:
+            targets.append(self.build_dir)
+        if self.install_dir.exists():
+            targets.append(self.install_dir)
+        if not targets:
+            return True
+        self._invalidate_build_dir_stat()
+        ok = True
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {executor.submit(self._remove_tree, d): d for d in targets}
+            for future in concurrent.futures.as_completed(futures):
+                target = futures[future]
+                if future.exception() is not None:
+                    log(
+                        "fail",
+                        f"Failed to remove {target}: {future.exception()}",
+                    )
+                    ok = False
+                else:
+                    log("ok", f"Removed {target}")
+        return ok
+
+
+def _load_answers(path):
+    """Parse an --answers file (YAML when PyYAML is available, else JSON)."""
+    text = Path(path).read_text()
+    try:
+        import yaml
+    except ImportError:
+        return json.loads(text)
+    return yaml.safe_load(text)
+
+
+def main():
+    try:
+        return _main()
+    finally:
+        flush_log()
+
+
+def _main():
+    parser = argparse.ArgumentParser(description="FFTS build helper")
+    parser.add_argument(
+        "action",
+        choices=[
+            "configure",
+            "build",
+            "test",
+            "install",
+            "clean",
+            "all",
+            "show-config",
+            "interactive",
+        ],
+    )
+    parser.add_argument("--preset", help="apply a named configuration preset")
+    parser.add_argument("--generator", help="override the CMake generator")
+    parser.add_argument(
+        "--answers",
+        metavar="PATH",
+        help="answer interactive prompts from a YAML/JSON file",
+    )
+    parser.add_argument("--jobs", type=int, help="override parallel job count")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    build_config = BuildConfig()
+    preset_mode = False
+    if args.preset:
+        if not build_config.apply_preset(args.preset):
+            return 1
+        build_config.save_config()
+        preset_mode = True
+    if args.jobs:
+        build_config.config["parallel_jobs"] = args.jobs
+    if args.generator:
+        build_config.config["generator"] = args.generator
+
+    build_system = BuildSystem(build_config)
+
+    if args.action == "show-config":
+        build_config.show_config()
+        return 0
+    if args.action == "interactive":
+        answers = _load_answers(args.answers) if args.answers else None
+        build_config.interactive_config(answers)
+        return 0
+    if args.action == "clean":
+        return 0 if build_system.clean() else 1
+
+    if not build_system.check_requirements():
+        return 1
+
+    def run_configure():
+        if preset_mode:
+            # Keep CMakePresets.json (next to this script, where cmake
+            # expects it) current before handing configuration to
+            # cmake --preset; emit only rewrites the file when its
+            # content changed, so the stamp short-circuit still holds.
+            build_config.emit_cmake_presets(
+                build_system.source_dir / "CMakePresets.json"
+            )
+            return build_system.configure_preset(args.preset, verbose=args.verbose)
+        return build_system.configure(verbose=args.verbose)
+
+    if args.action == "configure":
+        ok = run_configure()
+    elif args.action == "build":
+        ok = run_configure() and build_system.build(verbose=args.verbose)
+    elif args.action == "test":
+        ok = build_system.test(verbose=args.verbose)
+    elif args.action == "install":
+        ok = build_system.install()
+    elif args.action == "all":
+        ok = (
+            run_configure()
+            and build_system.build(verbose=args.verbose)
+            and build_system.test(verbose=args.verbose)
+        )
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())